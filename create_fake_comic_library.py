@@ -65,8 +65,7 @@ def generate_random_filename():
     return f"{base_name} {random_number:03}.cbz"
 
 
-if not os.path.exists(top_level_directory):
-    os.makedirs(top_level_directory)
+os.makedirs(top_level_directory, exist_ok=True)
 
 
 def create_random_directory(publisher):
@@ -75,9 +74,7 @@ def create_random_directory(publisher):
     publisher_directory = os.path.join(top_level_directory, publisher)
     random_directory = os.path.join(publisher_directory, random_name)
 
-    if not os.path.exists(publisher_directory):
-        os.makedirs(publisher_directory)
-
+    # Also creates publisher_directory the first time it's needed
     os.makedirs(random_directory)
     zip_filename = generate_random_filename()
 
@@ -16,41 +16,66 @@ python find_junk_in_cbz.py.py
 
 import os
 import zipfile
-import glob
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+# NAS metadata and recycle bin folders, compared against lowercased folder names
+ignore_folders = frozenset({".zzz_check", "@eadir", "@recycle", "#recycle"})
+
+
+def find_cbz_files(directory):
+    cbz_files = []
+    for root, dirs, files in os.walk(directory, followlinks=True):
+        # Skip hidden and ignored folders
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d.lower() not in ignore_folders]
+        cbz_files.extend(os.path.join(root, file) for file in files if file.endswith('.cbz') and not file.startswith('.'))
+    return cbz_files
+
+
+def find_non_image_files(cbz_file_path):
+    # Only reads the central directory, so the work is I/O-bound and threads overlap well
+    non_image_files = []
+    with zipfile.ZipFile(cbz_file_path, 'r') as cbz_file:
+        for info in cbz_file.infolist():
+            # Exclude directory entries and check for non-image extensions
+            if info.is_dir():
+                continue
+            # Keep each entry together with its lowercased extension
+            name = info.filename.lower()
+            if not name.endswith((".jpg", ".jpeg", ".png", ".gif", ".xml", ".webp", ".avif")):
+                non_image_files.append((info, os.path.splitext(name)[1]))
+    return non_image_files
+
 
 library_path = input("Enter the path to your library files: ")
 
-cbz_files = glob.glob(os.path.join(library_path, '**/*.cbz'), recursive=True)
+cbz_files = find_cbz_files(library_path)
 
 total_non_image_files = 0
 total_non_image_size = 0
-extension_count = {}
-extension_size = {}
+extension_count = Counter()
+extension_size = Counter()
 
 log_file_path = "non_image_files.log"
 with open(log_file_path, "w") as log_file:
-    for cbz_file_path in cbz_files:
-        with zipfile.ZipFile(cbz_file_path, 'r') as cbz_file:
-            for info in cbz_file.infolist():
-                # Exclude directory entries and check for non-image extensions
-                if not info.is_dir() and not info.filename.lower().endswith((".jpg", ".jpeg", ".png", ".gif", ".xml", ".webp", ".avif")):
-                    total_non_image_size += info.file_size
-                    total_non_image_files += 1
-                    log_file.write(f"{os.path.join(cbz_file_path, info.filename)}\n")
-                    _, ext = os.path.splitext(info.filename)
-                    ext = ext.lower()
-                    # Apple is special
-                    if not ext:
-                        ext = '.DS_Store'
-                    extension_count[ext] = extension_count.get(ext, 0) + 1
-                    extension_size[ext] = extension_size.get(ext, 0) + info.file_size
-
-    # Sort the extension_count dictionary by count values in descending order
-    sorted_extension_count = dict(sorted(extension_count.items(), key=lambda x: x[1], reverse=True))
+    with ThreadPoolExecutor() as executor:
+        # map() keeps the results in cbz_files order so the log stays deterministic
+        for cbz_file_path, non_image_files in zip(cbz_files, executor.map(find_non_image_files, cbz_files)):
+            for info, ext in non_image_files:
+                total_non_image_size += info.file_size
+                total_non_image_files += 1
+                log_file.write(f"{os.path.join(cbz_file_path, info.filename)}\n")
+                # Apple is special
+                if not ext:
+                    ext = '.DS_Store'
+                extension_count[ext] += 1
+                extension_size[ext] += info.file_size
 
     log_file.write("\nExtension Type Statistics (Ordered by Count):\n")
-    for ext, count in sorted_extension_count.items():
-        size_bytes = extension_size.get(ext, 0)
+    # most_common() already returns the extensions by count in descending order
+    for ext, count in extension_count.most_common():
+        size_bytes = extension_size[ext]
         size_mb = size_bytes / (1024 * 1024)
         log_file.write(f"{ext}: {count} times, Total Size: {size_bytes} bytes ({size_mb:.2f} MB)\n")
 
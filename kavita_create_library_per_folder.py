@@ -30,7 +30,8 @@ from urllib.parse import urlparse
 import os
 import time
 
-global_ignore_folders = [".zzz_check", "@eaDir", "@Recycle", "#recycle"]
+# Compared against lowercased folder names
+global_ignore_folders = frozenset({".zzz_check", "@eadir", "@recycle", "#recycle"})
 
 
 def authenticate(url):
@@ -62,47 +63,21 @@ def submit_folders(jwt_token, host_address, path, exclude_list, library_type, do
         "Authorization": f"Bearer {jwt_token}",
         "Content-Type": "application/json"
     }
-
-    for entry in os.scandir(path):
-        if entry.is_dir():
-            if entry.name.lower() in global_ignore_folders:
-                print(f"Skipping folder '{entry.name}' due to global exclusion.")
-                continue
-            if exclude_list is not None and entry.name.lower() in [name.lower() for name in exclude_list]:
-                print(f"Skipping folder '{entry.name}' due to exclusion.")
-                continue
-        if docker_modifier is None and entry.name not in exclude_list:
-            payload = {
-                "name":entry.name,
-                "type":library_type,
-                "folders": [f'{entry.path}'],
-                "folderWatching": True,
-                "includeInDashboard": True,
-                "includeInRecommended": True,
-                "includeInSearch": True,
-                "manageCollections": True,
-                "manageReadingLists": True,
-                "allowScrobbling": True,
-                "fileGroupTypes": [1],
-                "excludePatterns": [""]
-            }
-            print(f'No Docker Modifier Found')
-            response = requests.post(host_address + addlib_endpoint, headers=headers, json=payload)
-            if response.status_code != 200:
-                print("Error: Failed to post data to API.")
-                return
-            print(f"Folder '{entry.name}' sent. Response: {response.status_code}")
-            time.sleep(0.5)
-        else:
+    excluded_folders = {name.lower() for name in exclude_list or ()}
+    with requests.Session() as session:
+        for entry in os.scandir(path):
             if entry.is_dir():
-                if entry.name.lower() in [name.lower() for name in exclude_list]:
+                if entry.name.lower() in global_ignore_folders:
+                    print(f"Skipping folder '{entry.name}' due to global exclusion.")
+                    continue
+                if entry.name.lower() in excluded_folders:
                     print(f"Skipping folder '{entry.name}' due to exclusion.")
                     continue
-                docker_path = get_docker_path(entry.path, docker_modifier)
+            if docker_modifier is None and entry.name.lower() not in excluded_folders:
                 payload = {
-                    "name": entry.name,
-                    "type": library_type,
-                    "folders": [docker_path],
+                    "name":entry.name,
+                    "type":library_type,
+                    "folders": [f'{entry.path}'],
                     "folderWatching": True,
                     "includeInDashboard": True,
                     "includeInRecommended": True,
@@ -113,14 +88,41 @@ def submit_folders(jwt_token, host_address, path, exclude_list, library_type, do
                     "fileGroupTypes": [1],
                     "excludePatterns": [""]
                 }
-                print(f'🐳 Docker Modifier Found 🐳')
-                response = requests.post(host_address + addlib_endpoint, headers=headers, json=payload)
+                print(f'No Docker Modifier Found')
+                response = session.post(host_address + addlib_endpoint, headers=headers, json=payload)
                 if response.status_code != 200:
                     print("Error: Failed to post data to API.")
                     return
                 print(f"Folder '{entry.name}' sent. Response: {response.status_code}")
-                print()
                 time.sleep(0.5)
+            else:
+                if entry.is_dir():
+                    if entry.name.lower() in excluded_folders:
+                        print(f"Skipping folder '{entry.name}' due to exclusion.")
+                        continue
+                    docker_path = get_docker_path(entry.path, docker_modifier)
+                    payload = {
+                        "name": entry.name,
+                        "type": library_type,
+                        "folders": [docker_path],
+                        "folderWatching": True,
+                        "includeInDashboard": True,
+                        "includeInRecommended": True,
+                        "includeInSearch": True,
+                        "manageCollections": True,
+                        "manageReadingLists": True,
+                        "allowScrobbling": True,
+                        "fileGroupTypes": [1],
+                        "excludePatterns": [""]
+                    }
+                    print(f'🐳 Docker Modifier Found 🐳')
+                    response = session.post(host_address + addlib_endpoint, headers=headers, json=payload)
+                    if response.status_code != 200:
+                        print("Error: Failed to post data to API.")
+                        return
+                    print(f"Folder '{entry.name}' sent. Response: {response.status_code}")
+                    print()
+                    time.sleep(0.5)
 
 
 def main():
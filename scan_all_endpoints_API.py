@@ -9,13 +9,11 @@ This will queue up all the libraries on your kavita install to scan. This method
 Software requirements:
 - Python 3 or later
 - requests
-- json
 
 Usage:
 python scan_all_libraries_API.py
 """
 import requests
-import json
 from urllib.parse import urlparse
 
 url = input("Paste in your full ODPS URL from your Kavita user dashboard (/preferences#clients): ")
@@ -10,13 +10,11 @@ This will queue up all the libraries on your kavita install to scan. If you have
 Software requirements:
 - Python 3 or later
 - requests
-- json
 
 Usage:
 python scan_all_libraries.py
 """
 import requests
-import json
 from urllib.parse import urlparse
 
 url = input("Paste in your full ODPS URL from your Kavita user dashboard (/preferences#clients): ")
@@ -45,16 +43,18 @@ headers = {
     "Authorization": f"Bearer {jwt_token}",
     "Content-Type": "application/json"
 }
-response = requests.get(host_address + library_endpoint, headers=headers)
-
-if response.status_code == 200: # As long as the first API call to get all the data is successful
-    data = response.json()      # Store the reults as 'data'
-    for item in data:           
-        id = item["id"]
-        scan_response = requests.post(host_address + scan_endpoint + "?libraryId=" + str(id), headers=headers) # Submit results to the scan API
-        if scan_response.status_code == 200:
-            print(f"Successfully scanned / queued library number {id}")
-        else:
-            print(f"Failed to scan library item {id}")
-else:
-    print("Error: Failed to retrieve data from the API.")
+# One connection for the library list and every scan request
+with requests.Session() as session:
+    response = session.get(host_address + library_endpoint, headers=headers)
+
+    if response.status_code == 200: # As long as the first API call to get all the data is successful
+        data = response.json()      # Store the reults as 'data'
+        for item in data:           
+            id = item["id"]
+            scan_response = session.post(host_address + scan_endpoint + "?libraryId=" + str(id), headers=headers) # Submit results to the scan API
+            if scan_response.status_code == 200:
+                print(f"Successfully scanned / queued library number {id}")
+            else:
+                print(f"Failed to scan library item {id}")
+    else:
+        print("Error: Failed to retrieve data from the API.")